@@ -1,6 +1,6 @@
 from django.conf import settings
 
-from elasticsearch_dsl import Document, Date, Integer, Keyword, Text, Boolean
+from elasticsearch_dsl import Document, Date, Integer, Keyword, Text, Boolean, MetaField
 from elasticsearch_dsl import connections
 
 
@@ -23,6 +23,19 @@ class Comment(Document):
 
     class Index:
         name = 'comment'
+        settings = {
+            'number_of_shards': 1,
+            'number_of_replicas': 0,
+            'translog.durability': 'async',
+            # Documents are refreshed explicitly after indexing
+            'refresh_interval': '-1',
+        }
 
+    class Meta:
+        dynamic = MetaField('strict')
 
-Comment.init()
+
+
+# Index is kept between test runs, it is created only once and the existing index is not updated
+if not Comment._index.exists():
+    Comment.init()
@@ -47,6 +47,11 @@ class IssueResource(DjangoResource):
     def _obj_name(self, obj):
         return str(obj)
 
+    def _preload_queryset(self, qs):
+        return qs.select_related('created_by', 'solver', 'leader').prefetch_related(
+            'watched_by', 'watched_by__watched_issues'
+        )
+
 
 class UserResource(DjangoResource):
 
@@ -88,6 +93,9 @@ class UserResource(DjangoResource):
         'email': 'E-mail address',
     }
 
+    def _preload_queryset(self, qs):
+        return qs.select_related('solving_issue').prefetch_related('watched_issues')
+
 
 class ExtraResource(BaseResource):
 
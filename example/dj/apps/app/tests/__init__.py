@@ -6,7 +6,6 @@ from .order import *
 from .standard_operations import *
 from .extra_resource import *
 from .cors import *
-from .standard_operations import *
 from .compatibility import *
 from .serializer import *
 from .elasticsearch import *
@@ -1,4 +1,4 @@
-from six.moves.urllib.parse import urlencode
+from urllib.parse import urlencode
 
 from django.test import TestCase
 from django.test.utils import override_settings
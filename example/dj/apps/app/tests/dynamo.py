@@ -4,7 +4,6 @@ from germanium.decorators import data_consumer
 from germanium.tools.trivials import assert_in, assert_equal, assert_true, assert_is_not_none
 from germanium.tools.http import (assert_http_bad_request, assert_http_not_found, assert_http_method_not_allowed,
                                   assert_http_accepted, build_url)
-from germanium.tools.rest import assert_valid_JSON_created_response, assert_valid_JSON_response
 
 from .factories import UserFactory, IssueFactory
 from .test_case import PystonTestCase
@@ -35,7 +34,7 @@ class DynamodbTestCase(PystonTestCase):
 
     def test_get_Dynamo_comments_should_return_right_data(self):
         resp = self.get(self.COMMENT_API_URL.format(0))
-        assert_valid_JSON_response(resp)
+        self.assert_valid_JSON_response(resp)
         assert_equal(len(resp.json()), 4)
         for i, data in enumerate(resp.json()):
             assert_equal(data['priority'], i * 3)
@@ -52,7 +51,7 @@ class DynamodbTestCase(PystonTestCase):
 
     def test_get_one_Dynamo_comment_should_return_right_data(self):
         resp = self.get(f'{self.COMMENT_API_URL.format(0)}3/')
-        assert_valid_JSON_response(resp)
+        self.assert_valid_JSON_response(resp)
         data = resp.json()
         assert_equal(data['priority'], 3)
         assert_equal(data['user_id'], '3')
@@ -4,7 +4,6 @@ from germanium.decorators import data_consumer
 from germanium.tools.trivials import assert_in, assert_equal, assert_true, assert_is_not_none
 from germanium.tools.http import (assert_http_bad_request, assert_http_not_found, assert_http_method_not_allowed,
                                   assert_http_accepted, build_url)
-from germanium.tools.rest import assert_valid_JSON_created_response, assert_valid_JSON_response
 
 from .factories import UserFactory, IssueFactory
 from .test_case import PystonTestCase
@@ -31,11 +30,11 @@ class ElasticsearchTestCase(PystonTestCase):
 
     @classmethod
     def tearDownClass(cls):
-        Comment._index.delete()
+        Comment.search().params(refresh=True).delete()
 
     def test_get_elasticsearch_comments_should_return_right_data(self):
         resp = self.get(self.COMMENT_API_URL)
-        assert_valid_JSON_response(resp)
+        self.assert_valid_JSON_response(resp)
         assert_equal(len(resp.json()), 10)
         for i, data in enumerate(resp.json()):
             assert_equal(data['priority'], i)
@@ -47,7 +46,7 @@ class ElasticsearchTestCase(PystonTestCase):
     def test_get_one_elasticsearch_comment_should_return_right_data(self):
         for i in range(10):
             resp = self.get(f'{self.COMMENT_API_URL}{i}/')
-            assert_valid_JSON_response(resp)
+            self.assert_valid_JSON_response(resp)
             data = resp.json()
             assert_equal(data['priority'], i)
             assert_equal(data['user_id'], str(i))
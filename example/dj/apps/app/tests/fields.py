@@ -8,7 +8,6 @@ from django.utils.translation import ugettext
 from germanium.decorators import data_consumer
 from germanium.tools.trivials import assert_in, assert_equal, assert_not_equal
 from germanium.tools.http import assert_http_bad_request, assert_http_created
-from germanium.tools.rest import assert_valid_JSON_created_response, assert_valid_JSON_response
 
 import responses
 
@@ -31,7 +30,7 @@ class FieldsTestCase(PystonTestCase):
             ).decode('utf-8')
         }
         resp = self.post(self.USER_API_URL, data=data)
-        assert_valid_JSON_created_response(resp)
+        self.assert_valid_JSON_created_response(resp)
         data = self.deserialize(resp)
         assert_not_equal(data['contract'], None)
         assert_in('filename', data['contract'])
@@ -47,7 +46,7 @@ class FieldsTestCase(PystonTestCase):
             ).decode('utf-8')
         }
         resp = self.post(self.USER_API_URL, data=data)
-        assert_valid_JSON_created_response(resp)
+        self.assert_valid_JSON_created_response(resp)
         data = self.deserialize(resp)
         assert_not_equal(data['contract'], None)
         assert_in('filename', data['contract'])
@@ -85,7 +84,7 @@ class FieldsTestCase(PystonTestCase):
     def test_create_user_with_file_url(self, number, data):
         resp = self.get_file_url_response(data)
 
-        assert_valid_JSON_created_response(resp)
+        self.assert_valid_JSON_created_response(resp)
         data = self.deserialize(resp)
 
         assert_not_equal(data['contract'], None)
@@ -106,26 +105,26 @@ class FieldsTestCase(PystonTestCase):
         resp = self.post(self.USER_API_URL, data=user_data)
         issue_data['created_by'] = self.get_pk(resp)
         resp = self.post(self.ISSUE_API_URL, data=issue_data)
-        assert_valid_JSON_created_response(resp)
+        self.assert_valid_JSON_created_response(resp)
 
     @data_consumer('get_issues_data')
     def test_atomic_create_issue_with_user(self, number, data):
         users_before_count = User.objects.all().count()
         resp = self.post(self.ISSUE_API_URL, data=data)
-        assert_valid_JSON_created_response(resp)
+        self.assert_valid_JSON_created_response(resp)
         assert_equal(users_before_count + 2, User.objects.all().count())
 
     @data_consumer('get_issues_data')
     def test_atomic_update_issue_with_user(self, number, data):
         users_before_count = User.objects.all().count()
         resp = self.post(self.ISSUE_API_URL, data=data)
-        assert_valid_JSON_created_response(resp)
+        self.assert_valid_JSON_created_response(resp)
         assert_equal(users_before_count + 2, User.objects.all().count())
         data['created_by'] = self.get_user_data()
         data['created_by']['id'] = self.deserialize(resp)['created_by']['id']
         data['leader'] = self.get_user_data()
         resp = self.post(self.ISSUE_API_URL, data=data)
-        assert_valid_JSON_created_response(resp)
+        self.assert_valid_JSON_created_response(resp)
         assert_equal(users_before_count + 3, User.objects.all().count())
 
     @data_consumer('get_issues_and_users_data')
@@ -133,7 +132,7 @@ class FieldsTestCase(PystonTestCase):
         issues_before_count = Issue.objects.all().count()
         user_data['createdIssues'] = {'set': (issue_data,)}
         resp = self.post(self.USER_API_URL, data=user_data)
-        assert_valid_JSON_created_response(resp)
+        self.assert_valid_JSON_created_response(resp)
         assert_equal(issues_before_count + 1, Issue.objects.all().count())
 
     @data_consumer('get_issues_and_users_data')
@@ -143,7 +142,7 @@ class FieldsTestCase(PystonTestCase):
         user_data['createdIssues'] = {'add': (self.get_issue_data(), self.get_issue_data(), self.get_issue_data())}
         resp = self.post(self.USER_API_URL, data=user_data)
 
-        assert_valid_JSON_created_response(resp)
+        self.assert_valid_JSON_created_response(resp)
         assert_equal(issues_before_count + 3, Issue.objects.all().count())
         user_pk = self.get_pk(resp)
 
@@ -151,25 +150,25 @@ class FieldsTestCase(PystonTestCase):
         first_issue_data['solver'] = {'email': 'solver@email.cz', 'createdIssues': [self.get_issue_data()]}
 
         user_data['createdIssues'] = {'set': (first_issue_data, self.get_issue_data(), self.get_issue_data())}
-        resp = self.put('%s%s/' % (self.USER_API_URL, user_pk), data=user_data)
+        resp = self.put(self.USER_DETAIL_API_URL.format(user_pk), data=user_data)
         assert_equal(issues_before_count + 4, Issue.objects.all().count())
-        assert_valid_JSON_response(resp)
+        self.assert_valid_JSON_response(resp)
         user_data['createdIssues'] = {'remove': list(Issue.objects.filter(created_by=user_pk).
                                                      values_list('pk', flat=True))}
-        resp = self.put('%s%s/' % (self.USER_API_URL, self.get_pk(resp)), data=user_data)
-        assert_valid_JSON_response(resp)
+        resp = self.put(self.USER_DETAIL_API_URL.format(self.get_pk(resp)), data=user_data)
+        self.assert_valid_JSON_response(resp)
         assert_equal(issues_before_count + 1, Issue.objects.all().count())
 
         user_data['createdIssues'] = (self.get_issue_data(), self.get_issue_data(), self.get_issue_data())
-        resp = self.put('%s%s/' % (self.USER_API_URL, user_pk), data=user_data)
+        resp = self.put(self.USER_DETAIL_API_URL.format(user_pk), data=user_data)
         assert_equal(issues_before_count + 4, Issue.objects.all().count())
-        assert_valid_JSON_response(resp)
+        self.assert_valid_JSON_response(resp)
 
     @data_consumer('get_issues_and_users_data')
     def test_atomic_add_issues_by_m2m_reverse(self, number, issue_data, user_data):
         user_data['watchedIssues'] = {'add': (self.get_issue_data(), self.get_issue_data(), self.get_issue_data())}
         resp = self.post(self.USER_API_URL, data=user_data)
-        assert_valid_JSON_created_response(resp)
+        self.assert_valid_JSON_created_response(resp)
         watched_issues = self.deserialize(resp)['watchedIssues']
         assert_equal(len(watched_issues), 3)
         assert_equal(Issue.objects.all().count(), 3)
@@ -181,7 +180,7 @@ class FieldsTestCase(PystonTestCase):
         user_data2 = self.get_user_data()
         user_data2['watchedIssues'] = watched_issues_ids
         resp = self.post(self.USER_API_URL, data=user_data2)
-        assert_valid_JSON_created_response(resp)
+        self.assert_valid_JSON_created_response(resp)
         watched_issues = self.deserialize(resp)['watchedIssues']
         assert_equal(len(watched_issues), 3)
         assert_equal(Issue.objects.all().count(), 3)
@@ -197,7 +196,7 @@ class FieldsTestCase(PystonTestCase):
         user_data['createdIssues'] = {'add': (self.get_issue_data(), self.get_issue_data(), self.get_issue_data())}
         resp = self.post(self.USER_API_URL, data=user_data)
 
-        assert_valid_JSON_created_response(resp)
+        self.assert_valid_JSON_created_response(resp)
         assert_equal(issues_before_count, Issue.objects.all().count())
 
     @data_consumer('get_issues_data')
@@ -241,7 +240,7 @@ class FieldsTestCase(PystonTestCase):
         issue_data['created_by'] = user_data
         issue_data['watched_by'] = self.get_users_data(flat=True)
         resp = self.post(self.ISSUE_API_URL, data=issue_data)
-        assert_valid_JSON_created_response(resp)
+        self.assert_valid_JSON_created_response(resp)
         assert_equal(users_before_count + 12, User.objects.all().count())
 
         issue_data['leader'] = self.get_user_data()
@@ -249,7 +248,7 @@ class FieldsTestCase(PystonTestCase):
         issue_data['watched_by'] = {'set': self.get_users_data(flat=True)}
 
         resp = self.post(self.ISSUE_API_URL, data=issue_data)
-        assert_valid_JSON_created_response(resp)
+        self.assert_valid_JSON_created_response(resp)
         assert_equal(users_before_count + 24, User.objects.all().count())
 
     @data_consumer('get_issues_and_users_data')
@@ -257,7 +256,7 @@ class FieldsTestCase(PystonTestCase):
         issue_data['created_by'] = user_data
         issue_data['watched_by'] = {'add': self.get_users_data(flat=True)}
         resp = self.post(self.ISSUE_API_URL, data=issue_data)
-        assert_valid_JSON_created_response(resp)
+        self.assert_valid_JSON_created_response(resp)
         assert_equal(len(self.deserialize(resp).get('watched_by')), 10)
 
         pk = self.get_pk(resp)
@@ -265,13 +264,13 @@ class FieldsTestCase(PystonTestCase):
         issue_data['leader'] = self.get_user_data()
         issue_data['watched_by'] = {'add': self.get_users_data(flat=True),
                                     'remove': [obj.get('id') for obj in self.deserialize(resp).get('watched_by')][:5]}
-        resp = self.put('%s%s/' % (self.ISSUE_API_URL, pk), data=issue_data)
+        resp = self.put(self.ISSUE_DETAIL_API_URL.format(pk), data=issue_data)
         assert_equal(len(self.deserialize(resp).get('watched_by')), 15)
 
         issue_data['watched_by'] = self.get_users_data(flat=True)
         issue_data['created_by'] = self.get_user_data()
         issue_data['leader'] = self.get_user_data()
-        resp = self.put('%s%s/' % (self.ISSUE_API_URL, pk), data=issue_data)
+        resp = self.put(self.ISSUE_DETAIL_API_URL.format(pk), data=issue_data)
         assert_equal(len(self.deserialize(resp).get('watched_by')), 10)
 
     @data_consumer('get_issues_and_users_data')
@@ -324,23 +323,23 @@ class FieldsTestCase(PystonTestCase):
         issue_data['created_by'] = self.get_user_data()
         user_data['leading_issue'] = issue_data
         resp = self.post(self.USER_API_URL, data=user_data)
-        assert_valid_JSON_created_response(resp)
+        self.assert_valid_JSON_created_response(resp)
         assert_equal(issues_before_count + 1, Issue.objects.all().count())
 
         pk = self.get_pk(resp)
         user_data = {'leading_issue': None}
-        resp = self.patch('%s%s/' % (self.USER_API_URL, pk), data=user_data)
-        assert_valid_JSON_response(resp)
+        resp = self.patch(self.USER_DETAIL_API_URL.format(pk), data=user_data)
+        self.assert_valid_JSON_response(resp)
         assert_equal(issues_before_count, Issue.objects.all().count())
 
         user_data = {'leading_issue': None}
-        resp = self.patch('%s%s/' % (self.USER_API_URL, pk), data=user_data)
-        assert_valid_JSON_response(resp)
+        resp = self.patch(self.USER_DETAIL_API_URL.format(pk), data=user_data)
+        self.assert_valid_JSON_response(resp)
         assert_equal(issues_before_count, Issue.objects.all().count())
 
         user_data = {'leading_issue': self.get_issue_data()}
-        resp = self.patch('%s%s/' % (self.USER_API_URL, pk), data=user_data)
-        assert_valid_JSON_response(resp)
+        resp = self.patch(self.USER_DETAIL_API_URL.format(pk), data=user_data)
+        self.assert_valid_JSON_response(resp)
         assert_equal(issues_before_count + 1, Issue.objects.all().count())
 
     @data_consumer('get_issues_and_users_data')
@@ -363,7 +362,7 @@ class FieldsTestCase(PystonTestCase):
         user_data['created_issues_renamed'] = (self.get_issue_data(), self.get_issue_data(), self.get_issue_data())
         resp = self.post(self.USER_WITH_FORM_API_URL, data=user_data)
 
-        assert_valid_JSON_created_response(resp)
+        self.assert_valid_JSON_created_response(resp)
         assert_equal(issues_before_count + 3, Issue.objects.all().count())
 
     @data_consumer('get_issues_and_users_data')
@@ -374,7 +373,7 @@ class FieldsTestCase(PystonTestCase):
         issue_data['leader'] = self.get_user_data()
         resp = self.post(self.ISSUE_WITH_FORM_API_URL, data=issue_data)
 
-        assert_valid_JSON_created_response(resp)
+        self.assert_valid_JSON_created_response(resp)
         assert_equal(users_before_count + 2, User.objects.all().count())
 
     @data_consumer('get_issues_and_users_data')
@@ -415,7 +414,7 @@ class FieldsTestCase(PystonTestCase):
         issues_before_count = Issue.objects.all().count()
         user_data['leading_issue_renamed'] = self.get_issue_data()
         resp = self.post(self.USER_WITH_FORM_API_URL, data=user_data)
-        assert_valid_JSON_created_response(resp)
+        self.assert_valid_JSON_created_response(resp)
         assert_equal(issues_before_count + 1, Issue.objects.all().count())
 
     @data_consumer('get_issues_and_users_data')
@@ -520,7 +519,7 @@ class FieldsTestCase(PystonTestCase):
             ).decode('utf-8')
         }
         resp = self.post(self.USER_API_URL, data=data)
-        assert_valid_JSON_created_response(resp)
+        self.assert_valid_JSON_created_response(resp)
         assert_in('.txt', self.deserialize(resp)['contract']['filename'])
 
     @data_consumer('get_users_data')
@@ -532,7 +531,7 @@ class FieldsTestCase(PystonTestCase):
             'filename': 'test.csv'
         }
         resp = self.post(self.USER_API_URL, data=data)
-        assert_valid_JSON_created_response(resp)
+        self.assert_valid_JSON_created_response(resp)
         assert_in('.csv', self.deserialize(resp)['contract']['filename'])
 
     def test_create_issue_should_tags_be_parsed_as_a_list(self):
@@ -543,7 +542,7 @@ class FieldsTestCase(PystonTestCase):
         issue_data['another_users'] = [self.get_user_data()]
         resp = self.post(self.ISSUE_WITH_FORM_API_URL, data=issue_data)
 
-        assert_valid_JSON_created_response(resp)
+        self.assert_valid_JSON_created_response(resp)
         assert_equal(Issue.objects.last().tags, 'taga|tagb')
 
     def test_create_issue_should_tags_with_invalid_value_should_not_be_accepted(self):
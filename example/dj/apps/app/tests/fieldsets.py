@@ -1,8 +1,9 @@
 from unittest.case import TestCase
 
-from germanium.tools import assert_true, assert_false, assert_equal, assert_is_none
+from germanium.tools import assert_true, assert_false, assert_equal, assert_not_equal, assert_is_none
 
-from pyston.utils import rfs
+from pyston.utils import rfs, RFS
+from pyston.utils.datastructures import Field
 
 
 class FieldsetsTestCase(TestCase):
@@ -12,6 +13,16 @@ class FieldsetsTestCase(TestCase):
         assert_equal(str(rfs(('a', 'b', ('d', ('e__f',)), ('b', ('c',))))), 'a,b(c),d(e(f))')
         assert_equal(str(rfs(())), '')
 
+    def test_create_rfs_from_string(self):
+        assert_equal(str(RFS.create_from_string('a,b__c,b__g,d(e__f)')), 'a,b(c,g),d(e(f))')
+        assert_equal(str(RFS.create_from_string('a, b(c(i), g) ,a__h')), 'a(h),b(c(i),g)')
+        assert_equal(str(RFS.create_from_string('')), '')
+
+    def test_rfs_created_from_same_string_should_not_share_state(self):
+        fieldset = RFS.create_from_string('a,b(c)')
+        fieldset.append('b__d')
+        assert_equal(str(RFS.create_from_string('a,b(c)')), 'a,b(c)')
+
     def test_rfs_append(self):
         fieldset = rfs(('a', 'b', 'b__c', 'b__g', ('d', ('e__f',))))
         fieldset.append('a')
@@ -41,6 +52,20 @@ class FieldsetsTestCase(TestCase):
     def test_rfs_flat(self):
         assert_equal(rfs(('a', 'b', 'b__c', 'b__g', ('d', ('e__f',)))).flat(), {'a', 'b', 'd'})
 
+    def test_rfs_flat_should_follow_fieldset_changes(self):
+        fieldset = rfs(('a', 'b__c'))
+        assert_equal(fieldset.flat(), {'a', 'b'})
+        fieldset.append('d')
+        assert_equal(fieldset.flat(), {'a', 'b', 'd'})
+        fieldset.update(('e',))
+        assert_equal(fieldset.flat(), {'a', 'b', 'd', 'e'})
+        fieldset.subtract(('a',))
+        assert_equal(fieldset.flat(), {'b', 'd', 'e'})
+        fieldset.intersection(rfs(('b', 'd')))
+        assert_equal(fieldset.flat(), {'b', 'd'})
+        fieldset.join(('f',))
+        assert_equal(fieldset.flat(), {'b', 'd', 'f'})
+
     def test_rfs_bool(self):
         assert_true(rfs(('a', 'b', 'b__c', 'b__g', ('d', ('e__f',)))))
         assert_false(rfs())
@@ -75,3 +100,8 @@ class FieldsetsTestCase(TestCase):
         fieldset_b = rfs(('a__i', 'b', 'l'))
 
         assert_equal(str(fieldset_a.intersection(fieldset_b)), 'a(i),b')
+
+    def test_fields_should_be_compared_according_to_key_path(self):
+        assert_equal(Field(['a', 'b'], 'label'), Field(['a', 'b'], 'other label'))
+        assert_not_equal(Field(['a'], 'label'), Field(['b'], 'label'))
+        assert_equal(len({Field(['a', 'b'], 'label'), Field(['a', 'b'], None), Field(['a'], 'label')}), 2)
@@ -1,8 +1,8 @@
 from datetime import datetime
 
+from germanium.decorators import data_consumer
 from germanium.tools.trivials import assert_equal
 from germanium.tools.http import assert_http_bad_request, build_url
-from germanium.tools.rest import assert_valid_JSON_response
 
 from .factories import UserFactory, IssueFactory
 from .test_case import PystonTestCase
@@ -12,7 +12,7 @@ class FilterTestCase(PystonTestCase):
 
     def test_override_extra_filter_fields(self):
         assert_http_bad_request(self.get(build_url(self.USER_API_URL, filter='created_at__gt="1.1.1980"')))
-        assert_valid_JSON_response(
+        self.assert_valid_JSON_response(
             self.get(build_url(self.USER_API_URL, filter='email contains "test@test.cz"'))
         )
 
@@ -23,10 +23,10 @@ class FilterTestCase(PystonTestCase):
                                                    filter='email="test@test.cz" AND OR email="test@test.cz"')))
 
     def test_issue_can_filter_only_with_readable_fields_and_extra_field(self):
-        assert_valid_JSON_response(
+        self.assert_valid_JSON_response(
             self.get(build_url(self.ISSUE_API_URL, filter='solver__created_at="1.1.2017"'))
         )
-        assert_valid_JSON_response(self.get(build_url(self.ISSUE_API_URL, filter='created_at>"1.1.2017"')))
+        self.assert_valid_JSON_response(self.get(build_url(self.ISSUE_API_URL, filter='created_at>"1.1.2017"')))
         assert_http_bad_request(
             self.get(build_url(self.ISSUE_API_URL, filter='solver__manual_created_date>"1.1.2017"'))
         )
@@ -35,217 +35,81 @@ class FilterTestCase(PystonTestCase):
         now = datetime.now()
         [IssueFactory() for _ in range(5)]
 
-        resp = self.get(build_url(self.ISSUE_API_URL))
-        assert_equal(len(self.deserialize(resp)), 5)
-
-        resp = self.get(build_url(self.ISSUE_API_URL, filter='created_at>"{}"'.format(now.isoformat())))
-        assert_equal(len(self.deserialize(resp)), 5)
-
-        resp = self.get(build_url(self.ISSUE_API_URL, filter='created_at="{}"'.format(now.isoformat())))
-        assert_equal(len(self.deserialize(resp)), 0)
-
-        resp = self.get(build_url(self.ISSUE_API_URL, filter='created_at<"{}"'.format(now.isoformat())))
-        assert_equal(len(self.deserialize(resp)), 0)
-
-        resp = self.get(build_url(self.ISSUE_API_URL, filter='created_at contains "{}"'.format(now.date())))
-        assert_equal(len(self.deserialize(resp)), 5)
-
-        resp = self.get(build_url(self.ISSUE_API_URL, filter='created_at contains "{}"'.format(now.year)))
-        assert_equal(len(self.deserialize(resp)), 5)
-
-        resp = self.get(build_url(self.ISSUE_API_URL,
-                                  filter='created_at contains "{}"'.format('{} {}'.format(now.month, now.year))))
-        assert_equal(len(self.deserialize(resp)), 5)
-
-        resp = self.get(build_url(self.ISSUE_API_URL,
-                                  filter='created_at contains "{}"'.format('{} {}'.format(now.month + 1, now.year))))
-        assert_equal(len(self.deserialize(resp)), 0)
-
-        resp = self.get(build_url(self.ISSUE_API_URL, filter='created_at__day = "{}"'.format(now.day)))
-        assert_equal(len(self.deserialize(resp)), 5)
-
-        resp = self.get(
-            build_url(
+        assert_equal(len(self.get_json(self.ISSUE_API_URL)), 5)
+        assert_equal(len(self.get_json(self.ISSUE_API_URL, filter='created_at>"{}"'.format(now.isoformat()))), 5)
+        assert_equal(len(self.get_json(self.ISSUE_API_URL, filter='created_at="{}"'.format(now.isoformat()))), 0)
+        assert_equal(len(self.get_json(self.ISSUE_API_URL, filter='created_at<"{}"'.format(now.isoformat()))), 0)
+        assert_equal(len(self.get_json(self.ISSUE_API_URL, filter='created_at contains "{}"'.format(now.date()))), 5)
+        assert_equal(len(self.get_json(self.ISSUE_API_URL, filter='created_at contains "{}"'.format(now.year))), 5)
+        assert_equal(
+            len(self.get_json(
+                self.ISSUE_API_URL, filter='created_at contains "{} {}"'.format(now.month, now.year)
+            )),
+            5
+        )
+        assert_equal(
+            len(self.get_json(
+                self.ISSUE_API_URL, filter='created_at contains "{} {}"'.format(now.month + 1, now.year)
+            )),
+            0
+        )
+        assert_equal(len(self.get_json(self.ISSUE_API_URL, filter='created_at__day = "{}"'.format(now.day))), 5)
+        assert_equal(
+            len(self.get_json(
                 self.ISSUE_API_URL,
                 filter='created_at__day = "{}" AND created_at__year = "{}"'.format(now.day, now.year)
-            )
+            )),
+            5
         )
-        assert_equal(len(self.deserialize(resp)), 5)
-
-        resp = self.get(
-            build_url(
+        assert_equal(
+            len(self.get_json(
                 self.ISSUE_API_URL,
                 filter='created_at__day = "{}" AND created_at__year = "{}"'.format(now.day + 1, now.year)
-            )
+            )),
+            0
         )
-        assert_equal(len(self.deserialize(resp)), 0)
-
-        resp = self.get(
-            build_url(
+        assert_equal(
+            len(self.get_json(
                 self.ISSUE_API_URL,
                 filter='created_at__day = "{}" OR created_at__year = "{}"'.format(now.day + 1, now.year)
-            )
+            )),
+            5
         )
-        assert_equal(len(self.deserialize(resp)), 5)
-
-        resp = self.get(
-            build_url(
+        assert_equal(
+            len(self.get_json(
                 self.ISSUE_API_URL,
                 filter='(created_at__day = "{}" AND created_at__year = "{}") OR (created_at > "{}")'.format(
                     now.day + 1, now.year, now.isoformat()
                 )
-            )
+            )),
+            5
         )
-        assert_equal(len(self.deserialize(resp)), 5)
 
     def test_filter_issue_by_datetime_querystring_filter_parser(self):
         now = datetime.now()
         [IssueFactory() for _ in range(5)]
-        resp = self.get(
-            build_url(
-                self.ISSUE_API_URL, created_at__day=now.day, created_at__year=now.year
-            )
-        )
-        assert_equal(len(self.deserialize(resp)), 5)
+        assert_equal(len(self.get_json(self.ISSUE_API_URL, created_at__day=now.day, created_at__year=now.year)), 5)
 
-        resp = self.get(
-            build_url(
-                self.ISSUE_API_URL, created_at__day=now.day + 1, created_at__year=now.year
-            )
-        )
-        assert_equal(len(self.deserialize(resp)), 0)
-
-    def test_boolean_filter(self):
-        user = UserFactory(is_superuser=False)
-        superuser = UserFactory(is_superuser=True)
-
-        data = self.deserialize(self.get(build_url( self.USER_API_URL, is_superuser=0)))
-        assert_equal(len(data), 1)
-        assert_equal(data[0]['id'], user.pk)
-
-        data = self.deserialize(self.get(build_url(self.USER_API_URL, is_superuser=1)))
-        assert_equal(len(data), 1)
-        assert_equal(data[0]['id'], superuser.pk)
-
-        data = self.deserialize(self.get(build_url( self.USER_API_URL, is_superuser__not=0)))
-        assert_equal(len(data), 1)
-        assert_equal(data[0]['id'], superuser.pk)
-
-        data = self.deserialize(self.get(build_url( self.USER_API_URL, is_superuser__gt=0)))
-        assert_equal(len(data), 1)
-        assert_equal(data[0]['id'], superuser.pk)
-
-        data = self.deserialize(self.get(build_url( self.USER_API_URL, is_superuser__lt=0)))
-        assert_equal(len(data), 0)
-
-        data = self.deserialize(self.get(build_url( self.USER_API_URL, is_superuser__lt=1)))
-        assert_equal(len(data), 1)
-        assert_equal(data[0]['id'], user.pk)
-
-        assert_http_bad_request(self.get(build_url(self.USER_API_URL, is_superuser='invalid')))
-        assert_http_bad_request(self.get(build_url(self.USER_API_URL, is_superuser=3)))
-        assert_http_bad_request(self.get(build_url(self.USER_API_URL, is_superuser__gt=3)))
-        assert_http_bad_request(self.get(build_url(self.USER_API_URL, is_superuser__not='invalid')))
-        assert_http_bad_request(self.get(build_url(self.USER_API_URL, is_superuser__not='__none__')))
-
-    def test_string_filter(self):
-        issue1 = IssueFactory(name='issue with text: protocol')
-        issue2 = IssueFactory(name='issue with text: alcohol')
-
-        data = self.deserialize(self.get(build_url(self.ISSUE_API_URL, filter='name = "issue with text: protocol"')))
-        assert_equal(len(data), 1)
-        assert_equal(data[0]['id'], issue1.pk)
-
-        data = self.deserialize(self.get(build_url(self.ISSUE_API_URL, filter='name != "issue with text: protocol"')))
-        assert_equal(len(data), 1)
-        assert_equal(data[0]['id'], issue2.pk)
-
-        data = self.deserialize(self.get(build_url(self.ISSUE_API_URL, filter='name contains "protocol"')))
-        assert_equal(len(data), 1)
-        assert_equal(data[0]['id'], issue1.pk)
-
-        data = self.deserialize(self.get(build_url(self.ISSUE_API_URL, filter='name icontains "Protocol"')))
-        assert_equal(len(data), 1)
-        assert_equal(data[0]['id'], issue1.pk)
-
-        data = self.deserialize(self.get(build_url(self.ISSUE_API_URL, filter='name startswith "issue"')))
-        assert_equal(len(data), 2)
-
-        data = self.deserialize(self.get(build_url(self.ISSUE_API_URL, filter='name iendswith "oL"')))
-        assert_equal(len(data), 2)
-
-        data = self.deserialize(
-            self.get(
-                build_url(
-                    self.ISSUE_API_URL, filter='name in ["issue with text: protocol", "issue with text: alcohol"]'
-                )
-            )
-        )
-        assert_equal(len(data), 2)
-
-        data = self.deserialize(
-            self.get(
-                build_url(
-                    self.ISSUE_API_URL, filter='name in ["issue with text: protocol", "issue with text"]'
-                )
-            )
-        )
-        assert_equal(len(data), 1)
-        assert_equal(data[0]['id'], issue1.pk)
-
-        data = self.deserialize(self.get(build_url(self.ISSUE_API_URL, filter='name iexact "issue With tExt: prOtocol"')))
-        assert_equal(len(data), 1)
-        assert_equal(data[0]['id'], issue1.pk)
-
-    def test_integer_filter(self):
-        issue1 = IssueFactory(logged_minutes=150)
-        issue2 = IssueFactory(logged_minutes=31)
-        issue3 = IssueFactory(logged_minutes=None)
-
-        data = self.deserialize(self.get(build_url(self.ISSUE_API_URL, filter='logged_minutes = 150')))
-        assert_equal(len(data), 1)
-        assert_equal(data[0]['id'], issue1.pk)
-
-        data = self.deserialize(self.get(build_url(self.ISSUE_API_URL, filter='logged_minutes >= 31')))
-        assert_equal(len(data), 2)
-
-        data = self.deserialize(self.get(build_url(self.ISSUE_API_URL, filter='logged_minutes <= 150')))
-        assert_equal(len(data), 2)
-
-        data = self.deserialize(self.get(build_url(self.ISSUE_API_URL, filter='logged_minutes < 50')))
-        assert_equal(len(data), 1)
-        assert_equal(data[0]['id'], issue2.pk)
-
-        data = self.deserialize(self.get(build_url(self.ISSUE_API_URL, filter='logged_minutes in [null, 150, 31]')))
-        assert_equal(len(data), 3)
-
-        data = self.deserialize(self.get(build_url(self.ISSUE_API_URL, filter='logged_minutes = null')))
-        assert_equal(len(data), 1)
-        assert_equal(data[0]['id'], issue3.pk)
+        assert_equal(len(self.get_json(self.ISSUE_API_URL, created_at__day=now.day + 1, created_at__year=now.year)), 0)
 
     def test_foreign_key_filter(self):
         issue1 = IssueFactory()
         issue2 = IssueFactory(solver=issue1.created_by)
 
-        data = self.deserialize(self.get(build_url(self.ISSUE_API_URL, created_by=issue1.created_by.pk)))
+        data = self.get_json(self.ISSUE_API_URL, created_by=issue1.created_by.pk)
         assert_equal(len(data), 1)
         assert_equal(data[0]['id'], issue1.pk)
 
-        data = self.deserialize(self.get(build_url(self.ISSUE_API_URL, created_by__not=issue1.created_by.pk)))
+        data = self.get_json(self.ISSUE_API_URL, created_by__not=issue1.created_by.pk)
         assert_equal(len(data), 1)
         assert_equal(data[0]['id'], issue2.pk)
 
-        data = self.deserialize(
-            self.get(
-                build_url(
-                    self.ISSUE_API_URL,
-                    created_by__in='[{}, {}]'.format(issue1.created_by.pk, issue2.created_by.pk)
-                )
-            )
+        data = self.get_json(
+            self.ISSUE_API_URL, created_by__in='[{}, {}]'.format(issue1.created_by.pk, issue2.created_by.pk)
         )
         assert_equal(len(data), 2)
 
-        data = self.deserialize(self.get(build_url(self.ISSUE_API_URL, solver='__none__')))
+        data = self.get_json(self.ISSUE_API_URL, solver='__none__')
         assert_equal(len(data), 1)
         assert_equal(data[0]['id'], issue1.pk)
 
@@ -261,66 +125,24 @@ class FilterTestCase(PystonTestCase):
         issue1.watched_by.add(user1, user2)
         issue2.watched_by.add(user1)
 
-        data = self.deserialize(
-            self.get(
-                build_url(
-                    self.ISSUE_API_URL,
-                    watched_by=user2.pk
-                )
-            )
-        )
+        data = self.get_json(self.ISSUE_API_URL, watched_by=user2.pk)
         assert_equal(len(data), 1)
 
-        data = self.deserialize(
-            self.get(
-                build_url(
-                    self.ISSUE_API_URL,
-                    watched_by__in='({},{})'.format(user1.pk, user2.pk)
-                )
-            )
-        )
+        data = self.get_json(self.ISSUE_API_URL, watched_by__in='({},{})'.format(user1.pk, user2.pk))
         assert_equal(len(data), 2)
 
-        data = self.deserialize(
-            self.get(
-                build_url(
-                    self.ISSUE_API_URL,
-                    watched_by__in='({})'.format(user1.pk)
-                )
-            )
-        )
+        data = self.get_json(self.ISSUE_API_URL, watched_by__in='({})'.format(user1.pk))
         assert_equal(len(data), 2)
 
-        data = self.deserialize(
-            self.get(
-                build_url(
-                    self.ISSUE_API_URL,
-                    watched_by__in='({})'.format(user2.pk)
-                )
-            )
-        )
+        data = self.get_json(self.ISSUE_API_URL, watched_by__in='({})'.format(user2.pk))
         assert_equal(len(data), 1)
         assert_equal(data[0]['id'], issue1.pk)
 
-        data = self.deserialize(
-            self.get(
-                build_url(
-                    self.ISSUE_API_URL,
-                    watched_by__all='({},{})'.format(user1.pk, user2.pk)
-                )
-            )
-        )
+        data = self.get_json(self.ISSUE_API_URL, watched_by__all='({},{})'.format(user1.pk, user2.pk))
         assert_equal(len(data), 1)
         assert_equal(data[0]['id'], issue1.pk)
 
-        data = self.deserialize(
-            self.get(
-                build_url(
-                    self.ISSUE_API_URL,
-                    watched_by__all='({})'.format(user1.pk)
-                )
-            )
-        )
+        data = self.get_json(self.ISSUE_API_URL, watched_by__all='({})'.format(user1.pk))
         assert_equal(len(data), 2)
 
     def test_many_to_one_filter(self):
@@ -332,56 +154,23 @@ class FilterTestCase(PystonTestCase):
 
         assert_http_bad_request(self.get(build_url(self.USER_API_URL, created_issues=user1)))
 
-        data = self.deserialize(
-            self.get(
-                build_url(
-                    self.USER_API_URL,
-                    created_issues__in='({},{})'.format(issue1.pk, issue3.pk)
-                )
-            )
-        )
+        data = self.get_json(self.USER_API_URL, created_issues__in='({},{})'.format(issue1.pk, issue3.pk))
         assert_equal(len(data), 1)
         assert_equal(data[0]['id'], user1.pk)
 
-        data = self.deserialize(
-            self.get(
-                build_url(
-                    self.USER_API_URL,
-                    created_issues__in='({})'.format(issue1.pk)
-                )
-            )
-        )
+        data = self.get_json(self.USER_API_URL, created_issues__in='({})'.format(issue1.pk))
         assert_equal(len(data), 1)
         assert_equal(data[0]['id'], user1.pk)
 
-        data = self.deserialize(
-            self.get(
-                build_url(
-                    self.USER_API_URL,
-                    created_issues__in='({},{},{})'.format(issue1.pk, issue2.pk, issue3.pk)
-                )
-            )
-        )
+        data = self.get_json(self.USER_API_URL, created_issues__in='({},{},{})'.format(issue1.pk, issue2.pk, issue3.pk))
         assert_equal(len(data), 2)
 
-        data = self.deserialize(
-            self.get(
-                build_url(
-                    self.USER_API_URL,
-                    created_issues__all='({},{},{})'.format(issue1.pk, issue2.pk, issue3.pk)
-                )
-            )
+        data = self.get_json(
+            self.USER_API_URL, created_issues__all='({},{},{})'.format(issue1.pk, issue2.pk, issue3.pk)
         )
         assert_equal(len(data), 0)
 
-        data = self.deserialize(
-            self.get(
-                build_url(
-                    self.USER_API_URL,
-                    created_issues__all='({},{})'.format(issue1.pk, issue3.pk)
-                )
-            )
-        )
+        data = self.get_json(self.USER_API_URL, created_issues__all='({},{})'.format(issue1.pk, issue3.pk))
         assert_equal(len(data), 1)
         assert_equal(data[0]['id'], user1.pk)
 
@@ -392,14 +181,7 @@ class FilterTestCase(PystonTestCase):
         assert_http_bad_request(self.get(build_url(self.USER_API_URL, email__icontains='test1')))
         assert_http_bad_request(self.get(build_url(self.USER_API_URL, email__not='test1')))
 
-        data = self.deserialize(
-            self.get(
-                build_url(
-                    self.USER_API_URL,
-                    email__contains='test'
-                )
-            )
-        )
+        data = self.get_json(self.USER_API_URL, email__contains='test')
         assert_equal(len(data), 1)
         assert_equal(data[0]['id'], user.pk)
 
@@ -415,25 +197,11 @@ class FilterTestCase(PystonTestCase):
 
         assert_http_bad_request(self.get(build_url(self.USER_API_URL, watched_issues_count='invalid')))
 
-        data = self.deserialize(
-            self.get(
-                build_url(
-                    self.USER_API_URL,
-                    watched_issues_count=2
-                )
-            )
-        )
+        data = self.get_json(self.USER_API_URL, watched_issues_count=2)
         assert_equal(len(data), 1)
         assert_equal(data[0]['id'], user1.pk)
 
-        data = self.deserialize(
-            self.get(
-                build_url(
-                    self.USER_API_URL,
-                    watched_issues_count=1
-                )
-            )
-        )
+        data = self.get_json(self.USER_API_URL, watched_issues_count=1)
         assert_equal(len(data), 1)
         assert_equal(data[0]['id'], user2.pk)
 
@@ -443,24 +211,10 @@ class FilterTestCase(PystonTestCase):
 
         assert_http_bad_request(self.get(build_url(self.ISSUE_API_URL, description='test1')))
 
-        data = self.deserialize(
-            self.get(
-                build_url(
-                    self.ISSUE_API_URL,
-                    short_description__contains='test'
-                )
-            )
-        )
+        data = self.get_json(self.ISSUE_API_URL, short_description__contains='test')
         assert_equal(len(data), 2)
 
-        data = self.deserialize(
-            self.get(
-                build_url(
-                    self.ISSUE_API_URL,
-                    short_description='test1'
-                )
-            )
-        )
+        data = self.get_json(self.ISSUE_API_URL, short_description='test1')
         assert_equal(len(data), 1)
         assert_equal(data[0]['id'], issue1.pk)
 
@@ -471,23 +225,77 @@ class FilterTestCase(PystonTestCase):
         IssueFactory(solver=user1, logged_minutes=120, estimate_minutes=60)
         IssueFactory(solver=user2, logged_minutes=59, estimate_minutes=60)
 
-        data = self.deserialize(
-            self.get(
-                build_url(
-                    self.USER_API_URL,
-                    issues__overtime=1
-                )
-            )
-        )
+        data = self.get_json(self.USER_API_URL, issues__overtime=1)
         assert_equal(len(data), 1)
         assert_equal(data[0]['id'], user1.pk)
 
-        data = self.deserialize(
-            self.get(
-                build_url(
-                    self.USER_API_URL,
-                    issues__overtime=0,
-                )
-            )
-        )
+        data = self.get_json(self.USER_API_URL, issues__overtime=0)
         assert_equal(len(data), 5)
+
+
+class BooleanFilterTestCase(PystonTestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = UserFactory(is_superuser=False)
+        cls.superuser = UserFactory(is_superuser=True)
+
+    @data_consumer((
+        ({'is_superuser': 0}, ('user',)),
+        ({'is_superuser': 1}, ('superuser',)),
+        ({'is_superuser__not': 0}, ('superuser',)),
+        ({'is_superuser__gt': 0}, ('superuser',)),
+        ({'is_superuser__lt': 0}, ()),
+        ({'is_superuser__lt': 1}, ('user',)),
+    ))
+    def test_boolean_filter(self, querystring, expected_users):
+        data = self.get_json(self.USER_API_URL, **querystring)
+        assert_equal({obj['id'] for obj in data}, {getattr(self, user).pk for user in expected_users})
+
+    @data_consumer((
+        ({'is_superuser': 'invalid'},),
+        ({'is_superuser': 3},),
+        ({'is_superuser__gt': 3},),
+        ({'is_superuser__not': 'invalid'},),
+        ({'is_superuser__not': '__none__'},),
+    ))
+    def test_boolean_filter_with_invalid_value(self, querystring):
+        assert_http_bad_request(self.get(build_url(self.USER_API_URL, **querystring)))
+
+
+class IssueFieldFilterTestCase(PystonTestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.protocol_issue = IssueFactory(name='issue with text: protocol', logged_minutes=150)
+        cls.alcohol_issue = IssueFactory(name='issue with text: alcohol', logged_minutes=31)
+        cls.not_logged_issue = IssueFactory(name='not logged', logged_minutes=None)
+
+    def assert_filtered_issues(self, filter_string, expected_issues):
+        data = self.get_json(self.ISSUE_API_URL, filter=filter_string)
+        assert_equal({obj['id'] for obj in data}, {getattr(self, issue).pk for issue in expected_issues})
+
+    @data_consumer((
+        ('name = "issue with text: protocol"', ('protocol_issue',)),
+        ('name != "issue with text: protocol"', ('alcohol_issue', 'not_logged_issue')),
+        ('name contains "protocol"', ('protocol_issue',)),
+        ('name icontains "Protocol"', ('protocol_issue',)),
+        ('name startswith "issue"', ('protocol_issue', 'alcohol_issue')),
+        ('name iendswith "oL"', ('protocol_issue', 'alcohol_issue')),
+        ('name in ["issue with text: protocol", "issue with text: alcohol"]', ('protocol_issue', 'alcohol_issue')),
+        ('name in ["issue with text: protocol", "issue with text"]', ('protocol_issue',)),
+        ('name iexact "issue With tExt: prOtocol"', ('protocol_issue',)),
+    ))
+    def test_string_filter(self, filter_string, expected_issues):
+        self.assert_filtered_issues(filter_string, expected_issues)
+
+    @data_consumer((
+        ('logged_minutes = 150', ('protocol_issue',)),
+        ('logged_minutes >= 31', ('protocol_issue', 'alcohol_issue')),
+        ('logged_minutes <= 150', ('protocol_issue', 'alcohol_issue')),
+        ('logged_minutes < 50', ('alcohol_issue',)),
+        ('logged_minutes in [null, 150, 31]', ('protocol_issue', 'alcohol_issue', 'not_logged_issue')),
+        ('logged_minutes = null', ('not_logged_issue',)),
+    ))
+    def test_integer_filter(self, filter_string, expected_issues):
+        self.assert_filtered_issues(filter_string, expected_issues)
@@ -5,22 +5,22 @@ from decimal import Decimal
 from uuid import uuid4
 from datetime import date, datetime, time, timedelta
 
-from collections import OrderedDict
+from django.test.utils import override_settings
 
 from germanium.tools import assert_true, assert_equal
 
-from unittest.case import TestCase
+from unittest.case import TestCase, skipIf
 
 from app.models import User
 
+from pyston.converters import orjson
 from pyston.serializer import serialize
 
 
 class DirectSerializationTestCase(TestCase):
 
     def test_serialization(self):
-        for i in range(10):
-            User.objects.create(is_superuser=True, email='test{}@test.cz'.format(i))
+        User.objects.bulk_create(User(is_superuser=True, email='test{}@test.cz'.format(i)) for i in range(10))
         assert_true(isinstance(json.loads((serialize(User.objects.all()))), list))
         assert_true(isinstance(json.loads((serialize(User.objects.first()))), dict))
 
@@ -36,7 +36,7 @@ class DirectSerializationTestCase(TestCase):
         xml.dom.minidom.parseString(serialize(User.objects.first(), converter_name='xml'))
 
     def test_direct_serialization_to_csv_should_create_columns_according_to_required_fieldset(self):
-        data = OrderedDict((('a', 1), ('b', 2)))
+        data = {'a': 1, 'b': 2}
         assert_equal(
             serialize(data, converter_name='csv'),
             '\ufeff\r\n'
@@ -62,7 +62,7 @@ class DirectSerializationTestCase(TestCase):
         uuid_value = uuid4()
         decimal_value = Decimal('105.689')
 
-        data = OrderedDict(
+        data = dict(
             now=now_value,
             today=today_value,
             timedelta=timedelta_value,
@@ -83,4 +83,20 @@ class DirectSerializationTestCase(TestCase):
                 'decimal': str(decimal_value),
                 'set': [1, 2, 3]
             }
-        )
\ No newline at end of file
+        )
+
+    @skipIf(orjson is None, 'orjson is not installed')
+    def test_direct_serialization_with_orjson_converter_should_return_same_data_as_json_converter(self):
+        data = dict(
+            now=datetime.now(),
+            today=date.today(),
+            timedelta=timedelta(days=5, hours=2, seconds=5),
+            uuid=uuid4(),
+            decimal=Decimal('105.689'),
+            set={1, 2, 3}
+        )
+        with override_settings(PYSTON_CONVERTERS=('pyston.converters.JsonConverter',)):
+            json_data = json.loads(serialize(data, converter_name='json'))
+        with override_settings(PYSTON_CONVERTERS=('pyston.converters.OrjsonConverter',)):
+            orjson_data = json.loads(serialize(data, converter_name='json'))
+        assert_equal(orjson_data, json_data)
@@ -1,11 +1,38 @@
-from germanium.test_cases.rest import RestTestCase
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from germanium.test_cases.rest import RestTestCase, JSON_CONTENT_TYPE
+from germanium.tools.http import build_url, assert_http_ok, assert_http_created
+from germanium.tools.trivials import assert_true, fail
+
+try:
+    # orjson is used only to speed up tests. It shouldn't be required if it isn't installed.
+    import orjson
+except ImportError:
+    orjson = None
 
 
 class PystonTestCase(RestTestCase):
 
+    if orjson:
+        SERIALIZERS = {
+            **RestTestCase.SERIALIZERS,
+            JSON_CONTENT_TYPE: lambda data: orjson.dumps(
+                data, default=DjangoJSONEncoder().default, option=orjson.OPT_PASSTHROUGH_DATETIME
+            ),
+        }
+
+        DESERIALIZERS = {
+            **RestTestCase.DESERIALIZERS,
+            JSON_CONTENT_TYPE: lambda resp: orjson.loads(resp.content),
+        }
+
     USER_API_URL = '/api/user/'
+    USER_DETAIL_API_URL = USER_API_URL + '{}/'
     USER_WITH_FORM_API_URL = '/api/user-form/'
     ISSUE_API_URL = '/api/issue/'
+    ISSUE_DETAIL_API_URL = ISSUE_API_URL + '{}/'
     ISSUE_WITH_FORM_API_URL = '/api/issue-form/'
     EXTRA_API_URL = '/api/extra/'
     COUNT_ISSUES_PER_USER = '/api/count-issues-per-user/'
@@ -17,39 +44,82 @@ class PystonTestCase(RestTestCase):
 
     DATA_AMOUNT = 10
 
+    def deserialize(self, resp, content_type=None):
+        # Tests often deserialize one response several times (get_pk, assertions), the content is parsed only once
+        content_type = content_type or JSON_CONTENT_TYPE
+        deserialized_data = resp.__dict__.setdefault('_deserialized_data', {})
+        if content_type not in deserialized_data:
+            deserialized_data[content_type] = super().deserialize(resp, content_type)
+        return deserialized_data[content_type]
+
+    def _assert_valid_JSON_content(self, resp, msg=None):
+        try:
+            self.deserialize(resp)
+        except ValueError:
+            fail(msg or 'Json is not valid')
+
+    def assert_valid_JSON_response(self, resp, msg=None):
+        """
+        Same as germanium assert_valid_JSON_response but the content is validated with the cached deserialize,
+        therefore the JSON is not parsed again by the following deserialize call.
+        """
+        assert_http_ok(resp, msg)
+        assert_true(resp['Content-Type'].startswith('application/json'), msg)
+        self._assert_valid_JSON_content(resp, msg)
+
+    def assert_valid_JSON_created_response(self, resp, msg=None):
+        """
+        Same as germanium assert_valid_JSON_created_response but the content is validated with the cached deserialize.
+        """
+        assert_http_created(resp, msg)
+        assert_true(resp['Content-Type'].startswith('application/json'), msg)
+        self._assert_valid_JSON_content(resp, msg)
+
+    def assert_queries_do_not_grow(self, url, add_rows):
+        """
+        Asserts that the number of queries of the GET request is the same before and after add_rows is called.
+        """
+        with CaptureQueriesContext(connection) as queries_context:
+            self.assert_valid_JSON_response(self.get(url))
+
+        add_rows()
+        with self.assertNumQueries(len(queries_context)):
+            self.assert_valid_JSON_response(self.get(url))
+
+    def get_json(self, url, **querystring):
+        return self.get(build_url(url, **querystring)).json()
+
     def get_pk(self, resp):
         return self.deserialize(resp).get('id')
 
     def get_pk_list(self, resp, only_pks=None):
+        only_pks = set(only_pks) if only_pks else None
         return [obj.get('id') for obj in self.deserialize(resp) if not only_pks or obj.get('id') in only_pks]
 
     def get_user_data(self, prefix='', **kwargs):
-        result = {'email': '%suser_%s@test.cz' % (prefix, self.user_id)}
+        result = {'email': f'{prefix}user_{self.user_id}@test.cz'}
         self.user_id += 1
         result.update(kwargs)
         return result
 
     def get_issue_data(self, prefix='', **kwargs):
-        result = {'name': 'Issue %s' % self.issue_id, 'created_by': self.get_user_data(prefix),
+        result = {'name': f'Issue {self.issue_id}', 'created_by': self.get_user_data(prefix),
                   'leader': self.get_user_data(prefix)}
         self.issue_id += 1
         result.update(kwargs)
         return result
 
     def get_users_data(self, prefix='', flat=False):
-        result = []
-        for i in range(self.DATA_AMOUNT):
-            if flat:
-                result.append(self.get_user_data(prefix))
-            else:
-                result.append((i, self.get_user_data(prefix)))
-        return result
+        if flat:
+            return [self.get_user_data(prefix) for _ in range(self.DATA_AMOUNT)]
+        else:
+            return [(i, self.get_user_data(prefix)) for i in range(self.DATA_AMOUNT)]
 
     def get_issues_data(self, prefix='', flat=False):
-        result = []
-        for i in range(self.DATA_AMOUNT):
-            result.append((i, self.get_issue_data(prefix)))
-        return result
+        if flat:
+            return [self.get_issue_data(prefix) for _ in range(self.DATA_AMOUNT)]
+        else:
+            return [(i, self.get_issue_data(prefix)) for i in range(self.DATA_AMOUNT)]
 
     def get_issues_and_users_data(self, prefix=''):
         result = []
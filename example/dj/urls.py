@@ -5,21 +5,22 @@ from app.dynamo.resource import CommentDynamoResource
 from app.elasticsearch.resource import CommentElasticsearchResource
 from app.resource import (
     IssueResource, UserResource, ExtraResource, CountIssuesPerUserResource, CountWatchersPerIssueResource,
-    TestCamelCaseResource, CountWatchersPerIssueResource, UserResource, UserWithFormResource, IssueWithFormResource
+    TestCamelCaseResource, UserWithFormResource, IssueWithFormResource
 )
 
 
+LIST_ALLOWED_METHODS = ('get', 'post', 'head', 'options')
+DETAIL_ALLOWED_METHODS = ('get', 'put', 'patch', 'delete', 'head', 'options')
+
+
 urlpatterns = [
-    url(r'^api/user/$', UserResource.as_view(allowed_methods=('get', 'post', 'head', 'options'))),
-    url(r'^api/user-form/$', UserWithFormResource.as_view(allowed_methods=('get', 'post', 'head', 'options'))),
-    url(r'^api/user/(?P<pk>\d+)/$', UserResource.as_view(
-        allowed_methods=('get', 'put', 'patch', 'delete', 'head', 'options')
-    )),
+    url(r'^api/user/$', UserResource.as_view(allowed_methods=LIST_ALLOWED_METHODS)),
+    url(r'^api/user-form/$', UserWithFormResource.as_view(allowed_methods=LIST_ALLOWED_METHODS)),
+    url(r'^api/user/(?P<pk>\d+)/$', UserResource.as_view(allowed_methods=DETAIL_ALLOWED_METHODS)),
     url(r'^api/test-cc/$', TestCamelCaseResource.as_view(allowed_methods=('get', 'post',))),
-    url(r'^api/issue/$', IssueResource.as_view(allowed_methods=('get', 'post', 'head', 'options'))),
-    url(r'^api/issue-form/$', IssueWithFormResource.as_view(allowed_methods=('get', 'post', 'head', 'options'))),
-    url(r'^api/issue/(?P<pk>\d+)/$',
-        IssueResource.as_view(allowed_methods=('get', 'put', 'patch', 'delete', 'head', 'options'))),
+    url(r'^api/issue/$', IssueResource.as_view(allowed_methods=LIST_ALLOWED_METHODS)),
+    url(r'^api/issue-form/$', IssueWithFormResource.as_view(allowed_methods=LIST_ALLOWED_METHODS)),
+    url(r'^api/issue/(?P<pk>\d+)/$', IssueResource.as_view(allowed_methods=DETAIL_ALLOWED_METHODS)),
     url(r'^api/extra/$', ExtraResource.as_view()),
     url(r'^api/count-issues-per-user/$', CountIssuesPerUserResource.as_view()),
     url(r'^api/count-watchers-per-issue/$', CountWatchersPerIssueResource.as_view()),
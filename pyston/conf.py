@@ -45,7 +45,7 @@ DEFAULTS = {
     'CORS_ALLOWED_HEADERS': ('X-Base', 'X-Offset', 'X-Fields', 'Origin', 'Content-Type', 'Accept'),
     'CORS_ALLOWED_EXPOSED_HEADERS': ('X-Total', 'X-Serialization-Format-Options', 'X-Fields-Options'),
     'JSON_CONVERTER_OPTIONS': {
-        'indent': 4
+        'separators': (',', ':')
     },
     'PDF_EXPORT_TEMPLATE': 'default_pdf_table.html',
     'FILE_SIZE_LIMIT': 5000000,
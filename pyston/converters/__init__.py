@@ -1,10 +1,9 @@
 import types
 import json
 
+from functools import lru_cache
 from io import StringIO
 
-from collections import OrderedDict
-
 from defusedxml import ElementTree as ET
 from django.core.serializers.json import DjangoJSONEncoder
 from django.http.response import HttpResponseBase
@@ -14,28 +13,51 @@ from django.utils.xmlutils import SimplerXMLGenerator
 from django.utils.module_loading import import_string
 from django.utils.html import format_html
 
+from pyston.utils.compatibility import OrderedDict
 from pyston.utils.helpers import UniversalBytesIO, serialized_data_to_python
 from pyston.utils.datastructures import FieldsetGenerator
 from pyston.conf import settings
 
 from .file_generators import CsvGenerator, XlsxGenerator, PdfGenerator, TxtGenerator
 
+try:
+    # orjson isn't standard with python. It shouldn't be required if it isn't used.
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import mimeparse
+except ImportError:
+    mimeparse = None
+
 
 def is_collection(data):
     return isinstance(data, (list, tuple, set, types.GeneratorType))
 
 
-def get_default_converters():
-    """
-    Register all converters from settings configuration.
-    """
+@lru_cache(maxsize=None)
+def _get_converters(converter_class_paths):
     converters = OrderedDict()
-    for converter_class_path in settings.CONVERTERS:
+    for converter_class_path in converter_class_paths:
         converter_class = import_string(converter_class_path)()
         converters[converter_class.format] = converter_class
     return converters
 
 
+@lru_cache(maxsize=None)
+def _get_converter_names_by_media_type(converters_items):
+    return {converter.media_type: name for name, converter in converters_items}
+
+
+def get_default_converters():
+    """
+    Register all converters from settings configuration.
+    """
+    # Converters are created only once for every configuration, converter instances are stateless
+    return _get_converters(tuple(settings.CONVERTERS)).copy()
+
+
 def get_default_converter_name(converters=None):
     """
     Gets default converter name
@@ -50,9 +72,9 @@ def get_converter(result_format, converters=None):
     """
     converters = get_default_converters() if converters is None else converters
 
-    if result_format in converters:
-        return converters.get(result_format)
-    else:
+    try:
+        return converters[result_format]
+    except KeyError:
         raise ValueError('No converter found for type {}'.format(result_format))
 
 
@@ -61,11 +83,6 @@ def get_converter_name_from_request(request, converters=None, input_serializatio
     Function for determining which converter name to use
     for output.
     """
-    try:
-        import mimeparse
-    except ImportError:
-        mimeparse = None
-
     context_key = 'accept'
     if input_serialization:
         context_key = 'content_type'
@@ -75,17 +92,10 @@ def get_converter_name_from_request(request, converters=None, input_serializatio
     default_converter_name = get_default_converter_name(converters)
 
     if mimeparse and context_key in request._rest_context:
-        supported_mime_types = set()
-        converter_map = {}
-        preferred_content_type = None
-        for name, converter_class in converters.items():
-            if name == default_converter_name:
-                preferred_content_type = converter_class.media_type
-            supported_mime_types.add(converter_class.media_type)
-            converter_map[converter_class.media_type] = name
-        supported_mime_types = list(supported_mime_types)
-        if preferred_content_type:
-            supported_mime_types.append(preferred_content_type)
+        converter_map = _get_converter_names_by_media_type(tuple(converters.items()))
+        preferred_content_type = converters[default_converter_name].media_type
+        # Preferred content type is added to the end of the list because mimeparse prefers the last best match
+        supported_mime_types = list(converter_map) + [preferred_content_type]
         try:
             preferred_content_type = mimeparse.best_match(supported_mime_types,
                                                           request._rest_context[context_key])
@@ -106,7 +116,7 @@ def get_converter_from_request(request, converters=None, input_serialization=Fal
 
 
 def get_supported_mime_types(converters):
-    return [converter.media_type for _, converter in converters.items()]
+    return [converter.media_type for converter in converters.values()]
 
 
 class Converter:
@@ -162,26 +172,43 @@ class XmlConverter(Converter):
     def _to_xml(self, xml, data):
         from pyston.serializer import LAZY_SERIALIZERS
 
-        if isinstance(data, LAZY_SERIALIZERS):
-            self._to_xml(xml, data.serialize())
-        elif is_collection(data):
-            for item in data:
-                xml.startElement('resource', {})
-                self._to_xml(xml, item)
-                xml.endElement('resource')
-        elif isinstance(data, dict):
-            for key, value in data.items():
-                xml.startElement(key, {})
-                self._to_xml(xml, value)
-                xml.endElement(key)
-        else:
-            xml.characters(force_text(data))
+        # Data are walked with an explicit stack of (element name, value) iterators instead of the recursion,
+        # the element name of every iterator is stored to the second stack to be closed when the iterator is exhausted
+        items_stack = [iter(((None, data),))]
+        element_names_stack = [None]
+        # Elements have no attributes, one empty attributes dict is shared by all of them
+        element_attrs = {}
+        while items_stack:
+            try:
+                element_name, value = next(items_stack[-1])
+            except StopIteration:
+                items_stack.pop()
+                element_name = element_names_stack.pop()
+                if element_name is not None:
+                    xml.endElement(element_name)
+                continue
+
+            if element_name is not None:
+                xml.startElement(element_name, element_attrs)
+
+            while isinstance(value, LAZY_SERIALIZERS):
+                value = value.serialize()
+
+            if is_collection(value):
+                items_stack.append((('resource', item) for item in value))
+                element_names_stack.append(element_name)
+            elif isinstance(value, dict):
+                items_stack.append(iter(value.items()))
+                element_names_stack.append(element_name)
+            else:
+                xml.characters(force_text(value))
+                if element_name is not None:
+                    xml.endElement(element_name)
 
-    def _encode(self, data, **kwargs):
+    def _encode_to_stream(self, output_stream, data, options=None, **kwargs):
+        # XML is written directly to the output stream without building the whole document in memory
         if data is not None:
-            stream = StringIO()
-
-            xml = SimplerXMLGenerator(stream, 'utf-8')
+            xml = SimplerXMLGenerator(output_stream, 'utf-8')
             xml.startDocument()
             xml.startElement(self.root_element_name, {})
 
@@ -190,9 +217,10 @@ class XmlConverter(Converter):
             xml.endElement(self.root_element_name)
             xml.endDocument()
 
-            return stream.getvalue()
-        else:
-            return ''
+    def _encode(self, data, **kwargs):
+        stream = StringIO()
+        self._encode_to_stream(stream, data, **kwargs)
+        return stream.getvalue()
 
     def _decode(self, data, **kwargs):
         try:
@@ -220,16 +248,55 @@ class JsonConverter(Converter):
     """
     media_type = 'application/json'
     format = 'json'
+    # Encoded JSON is written to the output stream in chunks of approximately this size
+    chunk_size = 64 * 1024
 
     def _encode_to_stream(self, output_stream, data, options=None, **kwargs):
         options = settings.JSON_CONVERTER_OPTIONS if options is None else options
         if data is not None:
-            json.dump(data, output_stream, cls=LazyDjangoJsonEncoder, ensure_ascii=False, **options)
+            chunks, chunks_size = [], 0
+            for chunk in LazyDjangoJsonEncoder(ensure_ascii=False, **options).iterencode(data):
+                chunks.append(chunk)
+                chunks_size += len(chunk)
+                if chunks_size >= self.chunk_size:
+                    output_stream.write(''.join(chunks))
+                    chunks, chunks_size = [], 0
+            if chunks:
+                output_stream.write(''.join(chunks))
 
     def _decode(self, data, **kwargs):
         return json.loads(data)
 
 
+if orjson:
+    class OrjsonConverter(JsonConverter):
+        """
+        JSON emitter which uses the orjson library to encode and decode data.
+        For its use must be installed library orjson
+        """
+
+        encoder_class = LazyDjangoJsonEncoder
+
+        def _get_orjson_option(self, options):
+            # orjson supports only indentation with two spaces
+            option = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+            if options.get('indent'):
+                option |= orjson.OPT_INDENT_2
+            if options.get('sort_keys'):
+                option |= orjson.OPT_SORT_KEYS
+            return option
+
+        def _encode_to_stream(self, output_stream, data, options=None, **kwargs):
+            options = settings.JSON_CONVERTER_OPTIONS if options is None else options
+            if data is not None:
+                output_stream.write(
+                    orjson.dumps(data, default=self.encoder_class().default, option=self._get_orjson_option(options))
+                )
+
+        def _decode(self, data, **kwargs):
+            return orjson.loads(data)
+
+
 class GeneratorConverter(Converter):
     """
     Generator converter is more complicated.
@@ -246,7 +313,7 @@ class GeneratorConverter(Converter):
 
     def _render_headers(self, field_name_list):
         result = []
-        if len(field_name_list) == 1 and '' in field_name_list:
+        if len(field_name_list) == 1 and str(field_name_list[0]) == '':
             return result
 
         for field_name in field_name_list:
@@ -256,33 +323,43 @@ class GeneratorConverter(Converter):
     def _get_recursive_value_from_row(self, data, key_path):
         from pyston.serializer import LAZY_SERIALIZERS
 
-        if isinstance(data, LAZY_SERIALIZERS):
-            return self._get_recursive_value_from_row(data.serialize(), key_path)
-        elif len(key_path) == 0:
-            return data
-        elif isinstance(data, dict):
-            return self._get_recursive_value_from_row(data.get(key_path[0], ''), key_path[1:])
-        elif is_collection(data):
-            return [self._get_recursive_value_from_row(val, key_path) for val in data]
-        else:
-            return ''
+        # Key path is walked in the loop, recursion is used only for the collections inside the row
+        for i, key in enumerate(key_path):
+            while isinstance(data, LAZY_SERIALIZERS):
+                data = data.serialize()
+
+            if isinstance(data, dict):
+                data = data.get(key, '')
+            elif is_collection(data):
+                return [self._get_recursive_value_from_row(val, key_path[i:]) for val in data]
+            else:
+                return ''
+
+        while isinstance(data, LAZY_SERIALIZERS):
+            data = data.serialize()
+        return data
 
     def _render_dict(self, value, first):
-        if first:
-            return '\n'.join(('{}: {}'.format(key, self.render_value(val, False)) for key, val in value.items()))
-        else:
-            return '({})'.format(
-                ', '.join(('{}: {}'.format(key, self.render_value(val, False)) for key, val in value.items()))
-            )
+        # str.join materializes its input so the list comprehension is cheaper than the generator
+        render_value = self.render_value
+        rendered_items = ['{}: {}'.format(key, render_value(val, False)) for key, val in value.items()]
+        return '\n'.join(rendered_items) if first else '({})'.format(', '.join(rendered_items))
 
     def _render_iterable(self, value, first):
-        if first:
-            return '\n'.join((self.render_value(val, False) for val in value))
-        else:
-            return '({})'.format(', '.join((self.render_value(val, False) for val in value)))
+        render_value = self.render_value
+        rendered_values = [render_value(val, False) for val in value]
+        return '\n'.join(rendered_values) if first else '({})'.format(', '.join(rendered_values))
 
     def render_value(self, value, first=True):
-        if isinstance(value, dict):
+        # The most common exact types are dispatched without the isinstance checks
+        value_type = type(value)
+        if value_type is str:
+            return value
+        elif value_type is dict:
+            return self._render_dict(value, first)
+        elif value_type is list or value_type is tuple:
+            return self._render_iterable(value, first)
+        elif isinstance(value, dict):
             return self._render_dict(value, first)
         elif is_collection(value):
             return self._render_iterable(value, first)
@@ -293,14 +370,16 @@ class GeneratorConverter(Converter):
         return self.render_value(self._get_recursive_value_from_row(data, field.key_path) or '')
 
     def _render_row(self, row, field_name_list):
-        return (self._get_value_from_row(row, field) for field in field_name_list)
+        get_value_from_row = self._get_value_from_row
+        return [get_value_from_row(row, field) for field in field_name_list]
 
     def _render_content(self, field_name_list, converted_data):
         constructed_data = converted_data
         if not is_collection(constructed_data):
             constructed_data = [constructed_data]
 
-        return (self._render_row(row, field_name_list) for row in constructed_data)
+        render_row = self._render_row
+        return (render_row(row, field_name_list) for row in constructed_data)
 
     def _encode_to_stream(self, output_stream, data, resource=None, requested_fields=None, direct_serialization=False,
                           **kwargs):
@@ -1,16 +1,21 @@
 import re
 
+from functools import lru_cache
+
 from pyston.converters import JsonConverter, is_collection
 
 
+@lru_cache(maxsize=512)
 def to_camel_case(snake_str):
-    if snake_str.startswith('_'):
-        return '_' + to_camel_case(snake_str[1:])
-    else:
-        components = snake_str.split('_')
-        # We capitalize the first letter of each component except the first one
-        # with the 'title' method and join them together.
-        return components[0] + ''.join(x.title() for x in components[1:])
+    # Leading underscores are kept, the same keys are converted for every serialized object therefore the result
+    # is cached
+    stripped_snake_str = snake_str.lstrip('_')
+    components = stripped_snake_str.split('_')
+    # We capitalize the first letter of each component except the first one
+    # with the 'title' method and join them together.
+    return (
+        '_' * (len(snake_str) - len(stripped_snake_str)) + components[0] + ''.join(x.title() for x in components[1:])
+    )
 
 
 def to_snake_case(name):
@@ -53,24 +53,24 @@ class CsvGenerator:
         if header:
             writer.writerow(self._prepare_list(header))
 
-        for row in data:
-            writer.writerow(self._prepare_list(row))
+        writer.writerows(self._prepare_list(row) for row in data)
 
     def _prepare_list(self, values):
-        prepared_row = []
-
-        for value in values:
-            value = self._prepare_value(value.get('value') if isinstance(value, dict) else value)
-            prepared_row.append(value)
-        return prepared_row
+        prepare_value = self._prepare_value
+        return [
+            prepare_value(value.get('value') if isinstance(value, dict) else value)
+            for value in values
+        ]
 
     def _prepare_value(self, value):
-        if isinstance(value, float):
-            value = ('%.2f' % value).replace('.', ',')
-        elif isinstance(value, Decimal):
-            value = force_text(value.quantize(TWOPLACES)).replace('.', ',')
-        else:
-            value = force_text(value)
+        # Most of the cells are strings which needn't be converted
+        if type(value) is not str:
+            if isinstance(value, float):
+                value = ('%.2f' % value).replace('.', ',')
+            elif isinstance(value, Decimal):
+                value = force_text(value.quantize(TWOPLACES)).replace('.', ',')
+            else:
+                value = force_text(value)
         return value.replace('&nbsp;', ' ')
 
 
@@ -87,8 +87,8 @@ class StreamCSV:
         self.stream.flush()
 
     def writerows(self, rows):
-        for row in rows:
-            self.writerow(row)
+        self.writer.writerows(rows)
+        self.stream.flush()
 
 
 class TxtGenerator:
@@ -6,8 +6,6 @@ from functools import reduce
 
 from urllib.parse import urlparse
 
-from collections import OrderedDict
-
 from django.conf import settings as django_settings
 from django.core.exceptions import ValidationError
 from django.http.response import HttpResponse, HttpResponseBase
@@ -34,6 +32,7 @@ from .exception import (RestException, ConflictException, NotAllowedException, D
                         UnprocessableEntity)
 from .forms import ISODateTimeField, RestModelForm, rest_modelform_factory, RestValidationError
 from .utils import coerce_rest_request_method, set_rest_context_to_request, rfs
+from .utils.compatibility import OrderedDict
 from .utils.helpers import str_to_class
 from .serializer import (
     ResourceSerializer, DjangoResourceSerializer, LazyMappedSerializedData, ModelResourceSerializer,
@@ -371,11 +370,13 @@ class BaseResource(PermissionsResourceMixin, metaclass=ResourceMetaClass):
     def _serialize(self, output_stream, result, status_code, http_headers):
         converter = self._get_converter()
         http_headers['Content-Type'] = converter.content_type
-        converter.encode_to_stream(
-            output_stream, self._get_converted_dict(result), resource=self, request=self.request,
-            status_code=status_code, http_headers=http_headers, result=result,
-            requested_fieldset=self._get_requested_fieldset(result)
-        )
+        # Body of the HEAD response is never sent, therefore only the headers are set
+        if self.request.method.upper() != 'HEAD':
+            converter.encode_to_stream(
+                output_stream, self._get_converted_dict(result), resource=self, request=self.request,
+                status_code=status_code, http_headers=http_headers, result=result,
+                requested_fieldset=self._get_requested_fieldset(result)
+            )
 
     def _deserialize(self):
         rm = self.request.method.upper()
@@ -490,7 +491,8 @@ class BaseResource(PermissionsResourceMixin, metaclass=ResourceMetaClass):
         return '{}.{}'.format(self._get_name(), get_converter_name_from_request(self.request, self.converters))
 
     def _get_allow_header(self):
-        return ','.join((method.upper() for method in self.check_permissions_and_get_allowed_methods()))
+        # Methods are sorted because allowed methods are stored in a set, the header value must be stable
+        return ','.join(sorted(method.upper() for method in self.check_permissions_and_get_allowed_methods()))
 
     def _get_headers(self, default_http_headers):
         origin = self.request.META.get('HTTP_ORIGIN')
@@ -749,11 +751,13 @@ class BaseModelResource(ModelResourceMixin, BaseResource):
             converter = get_converter_from_request(self.request, self.converters)
             http_headers['Content-Type'] = converter.content_type
 
-            converter.encode_to_stream(
-                output_stream, self._get_converted_dict(result), resource=self, request=self.request,
-                status_code=status_code, http_headers=http_headers, result=result,
-                requested_fields=self._get_requested_fieldset(result)
-            )
+            # Body of the HEAD response is never sent, therefore only the headers are set
+            if self.request.method.upper() != 'HEAD':
+                converter.encode_to_stream(
+                    output_stream, self._get_converted_dict(result), resource=self, request=self.request,
+                    status_code=status_code, http_headers=http_headers, result=result,
+                    requested_fields=self._get_requested_fieldset(result)
+                )
         except ValueError:
             raise UnsupportedMediaTypeException
 
@@ -773,7 +777,7 @@ class BaseModelResource(ModelResourceMixin, BaseResource):
         return super().render_response(result, http_headers, status_code, fieldset)
 
     def _get_allow_header(self):
-        return ','.join((
+        return ','.join(sorted(
             method.upper() for method in self.check_permissions_and_get_allowed_methods(obj=self._get_obj_or_none())
         ))
 
@@ -5,7 +5,7 @@ import mimetypes
 import os
 import types
 import enum
-from collections import OrderedDict
+from functools import lru_cache
 
 from django.db.models import Model
 from django.db.models.fields.files import FieldFile
@@ -22,7 +22,7 @@ from .converters import get_converter
 from .exception import NotAllowedException, UnsupportedMediaTypeException
 from .forms import RestDictError, RestDictIndexError, RestListError
 from .utils import rfs
-from .utils.compatibility import get_last_parent_pk_field_name, get_reverse_field_name
+from .utils.compatibility import OrderedDict, get_last_parent_pk_field_name, get_reverse_field_name
 from .utils.helpers import ModelIteratorHelper, UniversalBytesIO, serialized_data_to_python, str_to_class
 
 try:
@@ -115,6 +115,44 @@ def get_resource_or_none(request, thing, resource_typemapper=None):
     return resource_class(request) if resource_class else None
 
 
+@lru_cache(maxsize=None)
+def get_model_fields(model):
+    return {f.name: f for f in model._meta.fields if hasattr(f, 'serialize') and f.serialize}
+
+
+@lru_cache(maxsize=None)
+def get_m2m_fields(model):
+    return {f.name: f for f in model._meta.many_to_many if f.serialize}
+
+
+@lru_cache(maxsize=None)
+def get_reverse_fields(model):
+    return {
+        f.name: f for f in model._meta.get_fields()
+        if (f.one_to_many or f.one_to_one) and f.auto_created and not f.concrete
+    }
+
+
+@lru_cache(maxsize=None)
+def get_model_class_method(model, method_name):
+    return get_class_method(model, method_name)
+
+
+@lru_cache(maxsize=None)
+def _get_function_parameter_names(function):
+    return tuple(inspect.signature(function).parameters.keys())
+
+
+def get_method_parameter_names(method):
+    if inspect.ismethod(method) and inspect.isfunction(method.__func__):
+        # Parameters are cached for the function, the bound method doesn't have the first (self or cls) parameter
+        return _get_function_parameter_names(method.__func__)[1:]
+    elif inspect.isfunction(method):
+        return _get_function_parameter_names(method)
+    else:
+        return tuple(inspect.signature(method).parameters.keys())
+
+
 def get_thing_class(thing):
     return thing.model if isinstance(thing, (QuerySet, ModelIteratorHelper)) else type(thing)
 
@@ -280,9 +318,27 @@ class ModelSerializer(Serializer):
     obj_iterable_classes = (list, tuple)
     obj_class = object
 
+    def __init__(self, resource=None, request=None):
+        super().__init__(resource=resource, request=request)
+        self._resource_methods_returning_field_value = {}
+
     def _get_real_field_name(self, field_name):
         return field_name
 
+    def _get_resource_method_returning_field_value(self, real_field_name):
+        """
+        Returns resource method which returns the field value or None. The result is cached because one serializer
+        instance is used for serialization of all objects of the collection.
+        """
+        if not self.resource:
+            return None
+
+        if real_field_name not in self._resource_methods_returning_field_value:
+            self._resource_methods_returning_field_value[real_field_name] = (
+                self.resource.get_methods_returning_field_value([real_field_name]).get(real_field_name)
+            )
+        return self._resource_methods_returning_field_value[real_field_name]
+
     def _value_to_raw_verbose(self, val, obj, field_or_method=None, method_kwargs=None,
                               serialization_format=None, **kwargs):
         if hasattr(field_or_method, 'humanized') and field_or_method.humanized:
@@ -368,7 +424,7 @@ class ModelSerializer(Serializer):
         return id(obj)
 
     def _method_to_python(self, method, obj, serialization_format, allow_tags=False, requested_fieldset=None, **kwargs):
-        method_kwargs_names = list(inspect.signature(method).parameters.keys())
+        method_kwargs_names = get_method_parameter_names(method)
         method_kwargs = {}
 
         fun_kwargs = {
@@ -466,13 +522,11 @@ class ModelResourceSerializer(ResourceSerializerMixin, ModelSerializer):
             return self.resource.get_allowed_fields_rfs(obj)
 
     def _field_to_python(self, field_name, real_field_name, obj, serialization_format, allow_tags=False, **kwargs):
-        resource_method_fields = (
-            self.resource.get_methods_returning_field_value([real_field_name]) if self.resource else {}
-        )
+        resource_method = self._get_resource_method_returning_field_value(real_field_name)
 
-        if real_field_name in resource_method_fields:
+        if resource_method:
             return self._method_to_python(
-                resource_method_fields[real_field_name], obj, serialization_format, allow_tags=allow_tags, **kwargs
+                resource_method, obj, serialization_format, allow_tags=allow_tags, **kwargs
             )
         else:
             return super()._field_to_python(
@@ -672,16 +726,13 @@ class DjangoSerializer(ModelSerializer):
     obj_iterable_classes = (ModelIteratorHelper, QuerySet)
 
     def _get_model_fields(self, obj):
-        return {f.name: f for f in obj._meta.fields if hasattr(f, 'serialize') and f.serialize}
+        return get_model_fields(obj._meta.model)
 
     def _get_m2m_fields(self, obj):
-        return {f.name: f for f in obj._meta.many_to_many if f.serialize}
+        return get_m2m_fields(obj._meta.model)
 
     def _get_reverse_fields(self, obj):
-        return {
-            f.name: f for f in obj._meta.get_fields()
-            if (f.one_to_many or f.one_to_one) and f.auto_created and not f.concrete
-        }
+        return get_reverse_fields(obj._meta.model)
 
     def _value_to_raw_verbose(self, val,  obj, field_or_method=None, method_kwargs=None, serialization_format=None,
                               **kwargs):
@@ -741,17 +792,15 @@ class DjangoSerializer(ModelSerializer):
 
     def _field_to_python(self, field_name, real_field_name, obj, serialization_format, allow_tags=False, **kwargs):
 
-        resource_method_fields = (
-            self.resource.get_methods_returning_field_value([real_field_name]) if self.resource else {}
-        )
         model_fields = self._get_model_fields(obj)
         m2m_fields = self._get_m2m_fields(obj)
         reverse_fields = self._get_reverse_fields(obj)
 
         real_field_name = self._get_real_field_name(field_name)
-        if real_field_name in resource_method_fields:
+        resource_method = self._get_resource_method_returning_field_value(real_field_name)
+        if resource_method:
             return self._method_to_python(
-                resource_method_fields[real_field_name], obj, serialization_format, allow_tags=allow_tags, **kwargs
+                resource_method, obj, serialization_format, allow_tags=allow_tags, **kwargs
             )
         elif real_field_name in m2m_fields:
             return self._m2m_field_to_python(
@@ -770,7 +819,8 @@ class DjangoSerializer(ModelSerializer):
             )
         elif hasattr(obj.__class__, real_field_name):
             if real_field_name in reverse_fields:
-                val = getattr(obj, real_field_name, None) if hasattr(obj, real_field_name) else None
+                # Missing reverse one to one relation raises RelatedObjectDoesNotExist which is AttributeError
+                val = getattr(obj, real_field_name, None)
             else:
                 val = getattr(obj, real_field_name)
 
@@ -785,7 +835,7 @@ class DjangoSerializer(ModelSerializer):
             elif callable(val):
                 return self._method_to_python(val, obj, serialization_format, allow_tags=allow_tags, **kwargs)
             else:
-                method = get_class_method(obj, real_field_name)
+                method = get_model_class_method(obj.__class__, real_field_name)
                 return self._data_to_python(
                     self._value_to_raw_verbose(
                         val,
@@ -1,8 +1,7 @@
 import re
 
 from enum import Enum
-
-from collections import OrderedDict
+from functools import lru_cache
 
 from django.template.defaultfilters import lower
 from django.db import models
@@ -10,9 +9,14 @@ from django.utils.encoding import force_text
 
 from copy import deepcopy
 
+from .compatibility import OrderedDict
+
 
 LOOKUP_SEP = '__'
 
+# Matches field with subfields e.q. 'a(b,c)'
+FIELD_WITH_SUBFIELDS_PATTERN = re.compile(r'^[^\(\)]+\(.+\)$')
+
 
 def coerce_rest_request_method(request):
     """
@@ -123,6 +127,27 @@ def split_fields(fields_string):
         yield field
 
 
+@lru_cache(maxsize=512)
+def fields_string_to_list(fields_string):
+    """
+    Converts fields string to the immutable list format accepted by RestFieldset.create_from_list.
+    E.q. 'a,b(c,d__e)' is converted to ('a', ('b', ('c', ('d', ('e',)))))
+    """
+    fields = []
+    for field in split_fields(fields_string):
+        if FIELD_WITH_SUBFIELDS_PATTERN.search(field):
+            field_name, subfields_string = field[:len(field) - 1].split('(', 1)
+            if LOOKUP_SEP in field_name:
+                field_name, subfields_string = field.split(LOOKUP_SEP, 1)
+            fields.append((field_name, fields_string_to_list(subfields_string)))
+        elif LOOKUP_SEP in field:
+            field_name, subfields_string = field.split(LOOKUP_SEP, 1)
+            fields.append((field_name, fields_string_to_list(subfields_string)))
+        else:
+            fields.append(field)
+    return tuple(fields)
+
+
 class RestField:
 
     def __init__(self, name, subfieldset=None):
@@ -153,23 +178,8 @@ class RestFieldset:
 
     @classmethod
     def create_from_string(cls, fields_string):
-        fields = []
-        for field in split_fields(fields_string):
-            if is_match(r'^[^\(\)]+\(.+\)$', field):
-                field_name, subfields_string = field[:len(field) - 1].split('(', 1)
-                if LOOKUP_SEP in field_name:
-                    field_name, subfields_string = field.split(LOOKUP_SEP, 1)
-
-                subfieldset = RFS.create_from_string(subfields_string)
-            else:
-                field_name = field
-                subfieldset = None
-                if LOOKUP_SEP in field_name:
-                    field_name, subfields_string = field.split(LOOKUP_SEP, 1)
-                    subfieldset = RFS.create_from_string(subfields_string)
-
-            fields.append(RestField(field_name, subfieldset))
-        return RestFieldset(*fields)
+        # Parsed fields strings are cached, creating fieldset from the list is much cheaper than parsing
+        return cls.create_from_list(fields_string_to_list(fields_string))
 
     @classmethod
     def _create_field_from_list(cls, field):
@@ -203,6 +213,7 @@ class RestFieldset:
 
     def __init__(self, *fields):
         self.fields_map = OrderedDict()
+        self._flat = None
         for field in fields:
             if not isinstance(field, RestField):
                 field = RestField(field)
@@ -219,11 +230,11 @@ class RestFieldset:
         assert isinstance(rest_fieldset, RestFieldset)
 
         for rf in rest_fieldset.fields:
-            if rf.name not in self.fields_map:
-                self.fields_map[rf.name] = deepcopy(rf)
-            else:
-                self.fields_map[rf.name] = self.fields_map[rf.name].join(rf)
+            # Fields map is searched only once for every joined field
+            joined_rf = self.fields_map.get(rf.name)
+            self.fields_map[rf.name] = deepcopy(rf) if joined_rf is None else joined_rf.join(rf)
 
+        self._flat = None
         return self
 
     def intersection(self, rest_fieldset):
@@ -231,10 +242,12 @@ class RestFieldset:
 
         fields_map = self.fields_map
         self.fields_map = OrderedDict()
+        self._flat = None
 
         for name, rf in fields_map.items():
-            if name in rest_fieldset.fields_map:
-                self.append(rf.intersection(rest_fieldset.fields_map[name]))
+            intersected_rf = rest_fieldset.fields_map.get(name)
+            if intersected_rf is not None:
+                self.append(rf.intersection(intersected_rf))
 
         return self
 
@@ -246,6 +259,7 @@ class RestFieldset:
 
         fields_map = self.fields_map
         self.fields_map = OrderedDict()
+        self._flat = None
 
         for name, rf in fields_map.items():
             if name not in rest_fieldset.fields_map:
@@ -280,10 +294,12 @@ class RestFieldset:
         else:
             raise ValueError('field can be only list, tuple or string ({} [{}])'.format(field, type(field)))
 
-        if rest_field.name in self.fields_map:
-            rest_field = self.fields_map[rest_field.name].join(rest_field)
+        joined_rest_field = self.fields_map.get(rest_field.name)
+        if joined_rest_field is not None:
+            rest_field = joined_rest_field.join(rest_field)
 
         self.fields_map[rest_field.name] = rest_field
+        self._flat = None
         return self
 
     def update(self, rest_fieldset):
@@ -294,15 +310,16 @@ class RestFieldset:
 
         for rf in rest_fieldset.fields:
             rf = deepcopy(rf)
-            if rf.name not in self.fields_map:
-                self.fields_map[rf.name] = rf
-            else:
-                self.fields_map[rf.name] = self.fields_map[rf.name].join(rf)
+            updated_rf = self.fields_map.get(rf.name)
+            self.fields_map[rf.name] = rf if updated_rf is None else updated_rf.join(rf)
 
+        self._flat = None
         return self
 
     def flat(self):
-        return set(self.fields_map.keys())
+        if self._flat is None:
+            self._flat = frozenset(self.fields_map.keys())
+        return self._flat
 
     def __contains__(self, key):
         return key in self.fields_map
@@ -1,7 +1,16 @@
+import sys
+
 from django.core.exceptions import FieldError, FieldDoesNotExist
 from django.db.models import Model
 
 
+if sys.version_info >= (3, 7):
+    # Built-in dict preserves insertion order since Python 3.7 and it is faster than OrderedDict
+    OrderedDict = dict
+else:
+    from collections import OrderedDict  # noqa: F401
+
+
 def get_field_or_none(model, field_name):
     try:
         return model._meta.get_field(field_name)
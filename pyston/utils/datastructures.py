@@ -1,7 +1,11 @@
+from copy import deepcopy
+from functools import lru_cache
+
 from django.template.defaultfilters import capfirst
 from django.forms.utils import pretty_name
+from django.utils.functional import cached_property
 
-from pyston.utils import split_fields, is_match, LOOKUP_SEP, rfs
+from pyston.utils import split_fields, FIELD_WITH_SUBFIELDS_PATTERN, LOOKUP_SEP, rfs
 from pyston.utils.compatibility import get_model_from_relation_or_none
 
 
@@ -10,21 +14,42 @@ class Field:
     def __init__(self, key_path, label):
         self.key_path = key_path
         self.label = label
+        # Joined key path is used for hashing, it is computed only once
+        self._joined_key_path = LOOKUP_SEP.join(key_path)
 
-    def __str__(self):
+    @cached_property
+    def verbose_name(self):
         return capfirst(
             self.label if self.label is not None
             else pretty_name(' - '.join([key.replace('_', ' ').strip() for key in self.key_path]))
         )
 
+    def __str__(self):
+        return self.verbose_name
+
     def __hash__(self):
-        return hash(LOOKUP_SEP.join(self.key_path))
+        return hash(self._joined_key_path)
 
     def __eq__(self, other):
-        return self.__str__() == other.__str__()
+        # Fields are equal according to the key path to be consistent with the __hash__ method
+        if not isinstance(other, Field):
+            return NotImplemented
+        return self._joined_key_path == other._joined_key_path
+
+
+@lru_cache(maxsize=512)
+def parse_fields_string(fields_string):
+    parsed_fields = []
+    for field in split_fields(fields_string):
+        if LOOKUP_SEP in field:
+            field_name, subfields_string = field.split(LOOKUP_SEP, 1)
+        elif FIELD_WITH_SUBFIELDS_PATTERN.search(field):
+            field_name, subfields_string = field[:len(field) - 1].split('(', 1)
+        else:
+            field_name, subfields_string = field, None
 
-    def __ne__(self, other):
-        return not self.__eq__(other)
+        parsed_fields.append((field_name, subfields_string))
+    return tuple(parsed_fields)
 
 
 class FieldsetGenerator:
@@ -49,45 +74,46 @@ class FieldsetGenerator:
         # or similar formats
         return self.resource.get_allowed_fields_rfs() if isinstance(self.resource, ModelResourceMixin) else rfs()
 
+    @cached_property
+    def _allowed_fieldset(self):
+        # Allowed fieldset is computed only once for the whole generated fieldset
+        return self._get_allowed_fieldset()
+
     def _parse_fields_string(self, fields_string):
-        fields_string = fields_string or ''
-
-        parsed_fields = []
-        for field in split_fields(fields_string):
-            if LOOKUP_SEP in field:
-                field_name, subfields_string = field.split(LOOKUP_SEP, 1)
-            elif is_match(r'^[^\(\)]+\(.+\)$', field):
-                field_name, subfields_string = field[:len(field) - 1].split('(', 1)
-            else:
-                field_name, subfields_string = field, None
-
-            parsed_fields.append((field_name, subfields_string))
-        return parsed_fields
-
-    def _recursive_generator(self, fields, fields_string, model=None, key_path=None, extended_fieldset=None):
-        key_path = key_path or []
-
-        allowed_fieldset = self._get_allowed_fieldset()
-        if extended_fieldset:
-            allowed_fieldset.join(extended_fieldset)
-
-        parsed_fields = [
-            (field_name, subfields_string) for field_name, subfields_string in self._parse_fields_string(fields_string)
-            if field_name in allowed_fieldset or self.direct_serialization
-        ]
-
-        for field_name, subfields_string in parsed_fields:
-            self._recursive_generator(
-                fields, subfields_string, get_model_from_relation_or_none(model, field_name) if model else None,
-                key_path + [field_name],
-                extended_fieldset=allowed_fieldset[field_name].subfieldset if allowed_fieldset[field_name] else None
-            )
-        if not parsed_fields and key_path:
-            fields.append(
-                Field(key_path, self.resource.get_field_label(LOOKUP_SEP.join(key_path)) if self.resource else None)
-            )
+        return parse_fields_string(fields_string or '')
+
+    def _generate_fields(self, fields, fields_string, model=None, key_path=None, extended_fieldset=None):
+        # Nested fields are walked with an explicit stack instead of the recursion, children are pushed in the reversed
+        # order to keep the order of the generated fields
+        stack = [(fields_string, model, tuple(key_path or ()), extended_fieldset)]
+        while stack:
+            fields_string, model, key_path, extended_fieldset = stack.pop()
+
+            allowed_fieldset = self._allowed_fieldset
+            if extended_fieldset:
+                allowed_fieldset = deepcopy(allowed_fieldset).join(extended_fieldset)
+
+            parsed_fields = [
+                (field_name, subfields_string)
+                for field_name, subfields_string in self._parse_fields_string(fields_string)
+                if field_name in allowed_fieldset or self.direct_serialization
+            ]
+
+            for field_name, subfields_string in reversed(parsed_fields):
+                stack.append((
+                    subfields_string, get_model_from_relation_or_none(model, field_name) if model else None,
+                    key_path + (field_name,),
+                    allowed_fieldset[field_name].subfieldset if allowed_fieldset[field_name] else None
+                ))
+            if not parsed_fields and key_path:
+                fields.append(
+                    Field(
+                        list(key_path),
+                        self.resource.get_field_label(LOOKUP_SEP.join(key_path)) if self.resource else None
+                    )
+                )
 
     def generate(self):
         fields = []
-        self._recursive_generator(fields, self.fields_string, getattr(self.resource, 'model', None))
+        self._generate_fields(fields, self.fields_string, getattr(self.resource, 'model', None))
         return fields
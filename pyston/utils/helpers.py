@@ -74,9 +74,9 @@ class UniversalBytesIO:
     def make_bytes(self, value):
         """Turn a value into a bytestring encoded in the output charset."""
         if isinstance(value, bytes):
-            return bytes(value)
+            return value
         if isinstance(value, str):
-            return bytes(value.encode(self.charset))
+            return value.encode(self.charset)
 
         # Handle non-string types
         return force_bytes(value, self.charset)
@@ -89,7 +89,14 @@ class UniversalBytesIO:
             pass
 
 
+# Values of these types are returned unchanged, the exact type check is cheaper than the isinstance chain below
+PYTHON_DATA_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
 def serialized_data_to_python(data):
+    if type(data) in PYTHON_DATA_TYPES:
+        return data
+
     from pyston.serializer import LAZY_SERIALIZERS
 
     if isinstance(data, (types.GeneratorType, list, tuple)):